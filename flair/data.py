@@ -84,8 +84,9 @@ class Dictionary:
         :return: ID of string, otherwise 0
         """
         item_encoded = item.encode("utf-8")
-        if item_encoded in self.item2idx.keys():
-            return self.item2idx[item_encoded]
+        idx = self.item2idx.get(item_encoded)
+        if idx is not None:
+            return idx
         elif self.add_unk:
             return 0
         else:
@@ -346,9 +347,10 @@ class DataPoint:
             del self.annotation_layers[typename]
 
     def get_label(self, label_type: str = None, zero_tag_value="O"):
-        if len(self.get_labels(label_type)) == 0:
+        labels = self.get_labels(label_type)
+        if len(labels) == 0:
             return Label(self, zero_tag_value)
-        return self.get_labels(label_type)[0]
+        return labels[0]
 
     def get_labels(self, typename: str = None):
         if typename is None:
@@ -686,7 +688,7 @@ class Sentence(DataPoint):
         if isinstance(use_tokenizer, Tokenizer):
             tokenizer = use_tokenizer
 
-        elif type(use_tokenizer) == bool:
+        elif isinstance(use_tokenizer, bool):
             tokenizer = SegtokTokenizer() if use_tokenizer else SpaceTokenizer()
 
         else:
@@ -759,9 +761,9 @@ class Sentence(DataPoint):
         return sorted(spans)
 
     def get_token(self, token_id: int) -> Optional[Token]:
-        for token in self.tokens:
-            if token.idx == token_id:
-                return token
+        # a token's idx is its 1-based position in the sentence, so jump to it directly
+        if token_id is not None and 0 < token_id <= len(self.tokens):
+            return self.tokens[token_id - 1]
         return None
 
     def _add_token(self, token: Union[Token, str]):
@@ -1439,7 +1441,7 @@ class Corpus(typing.Generic[T_co]):
                     label_value_counter[label.value] += 1
 
                 # check if there are any span labels
-                if type(label.data_point) == Span and len(label.data_point) > 1:
+                if isinstance(label.data_point, Span) and len(label.data_point) > 1:
                     label_dictionary.span_labels = True
 
             if not label_dictionary.multi_label:
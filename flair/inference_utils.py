@@ -128,7 +128,7 @@ class WordEmbeddingsStore:
         deletes the original vectors to save memory
         """
         for embedding in WordEmbeddingsStore._word_embeddings(model):
-            if type(embedding) == WordEmbeddings:
+            if isinstance(embedding, WordEmbeddings):
                 WordEmbeddingsStore(embedding, backend)
                 del embedding.precomputed_word_embeddings
 
@@ -139,7 +139,7 @@ class WordEmbeddingsStore:
         """
         embeds = WordEmbeddingsStore._word_embeddings(model)
         for i, embedding in enumerate(embeds):
-            if type(embedding) == WordEmbeddings:
+            if isinstance(embedding, WordEmbeddings):
                 embeds[i] = WordEmbeddingsStore(embedding, backend)
 
     @staticmethod
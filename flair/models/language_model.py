@@ -177,7 +177,7 @@ class LanguageModel(nn.Module):
 
     def repackage_hidden(self, h):
         """Wraps hidden states in new Variables, to detach them from their history."""
-        if type(h) == torch.Tensor:
+        if isinstance(h, torch.Tensor):
             return h.clone().detach()
         else:
             return tuple(self.repackage_hidden(v) for v in h)
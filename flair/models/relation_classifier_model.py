@@ -384,14 +384,28 @@ class RelationClassifier(flair.nn.DefaultClassifier[EncodedSentence, EncodedSent
         """
         valid_entities: List[_Entity] = list(self._valid_entities(sentence))
 
-        # Use a dictionary to find gold relation annotations for a given entity pair
-        relation_to_gold_label: Dict[str, str] = {
-            relation.unlabeled_identifier: relation.get_label(self.label_type, zero_tag_value=self.zero_tag_value).value
+        # Sentences with fewer than two valid entities cannot produce any relation candidate,
+        # so skip building the gold annotation lookup for them
+        if len(valid_entities) < 2:
+            return
+
+        # Use a dictionary to find gold relation annotations for a given entity pair.
+        # It is keyed by the (head, tail) span identifiers, so candidate pairs can be
+        # looked up directly without constructing a throwaway `Relation` per pair.
+        relation_to_gold_label: Dict[Tuple[str, str], str] = {
+            (relation.first.unlabeled_identifier, relation.second.unlabeled_identifier): relation.get_label(
+                self.label_type, zero_tag_value=self.zero_tag_value
+            ).value
             for relation in sentence.get_relations(self.label_type)
         }
 
+        # Compute each span's identifier once instead of once per pair
+        span_identifiers: List[str] = [entity.span.unlabeled_identifier for entity in valid_entities]
+
         # Yield head and tail entity pairs from the cross product of all entities
-        for head, tail in itertools.product(valid_entities, repeat=2):
+        for (head, head_identifier), (tail, tail_identifier) in itertools.product(
+            zip(valid_entities, span_identifiers), repeat=2
+        ):
             # Remove identity relation entity pairs
             if head.span is tail.span:
                 continue
@@ -405,8 +419,7 @@ class RelationClassifier(flair.nn.DefaultClassifier[EncodedSentence, EncodedSent
                 continue
 
             # Obtain gold label, if existing
-            original_relation: Relation = Relation(first=head.span, second=tail.span)
-            gold_label: Optional[str] = relation_to_gold_label.get(original_relation.unlabeled_identifier)
+            gold_label: Optional[str] = relation_to_gold_label.get((head_identifier, tail_identifier))
 
             yield head, tail, gold_label
 
@@ -415,6 +428,7 @@ class RelationClassifier(flair.nn.DefaultClassifier[EncodedSentence, EncodedSent
         head: _Entity,
         tail: _Entity,
         gold_label: Optional[str] = None,
+        token_texts: Optional[List[str]] = None,
     ) -> EncodedSentence:
         """
         Returns a new `Sentence` object with masked/marked head and tail spans according to the encoding strategy.
@@ -423,32 +437,65 @@ class RelationClassifier(flair.nn.DefaultClassifier[EncodedSentence, EncodedSent
         :param head: The head `_Entity`
         :param tail: The tail `_Entity`
         :param gold_label: An optional gold label of the induced relation by the head and tail entity
+        :param token_texts: An optional pre-computed list of the original sentence's token texts.
+                            All entity pairs of a sentence share the same token texts,
+                            so callers that encode multiple pairs may compute the list once.
         :return: The `EncodedSentence` (with gold annotations)
         """
         # Some sanity checks
         original_sentence: Sentence = head.span.sentence
         assert original_sentence is tail.span.sentence, "The head and tail need to come from the same sentence."
 
-        # Pre-compute non-leading head and tail tokens for entity masking
-        non_leading_head_tokens: List[Token] = head.span.tokens[1:]
-        non_leading_tail_tokens: List[Token] = tail.span.tokens[1:]
-
         # We can not use the plaintext of the head/tail span in the sentence as the mask/marker
         # since there may be multiple occurrences of the same entity mentioned in the sentence.
         # Therefore, we use the span's position in the sentence.
-        encoded_sentence_tokens: List[str] = []
-        for token in original_sentence:
-            if token is head.span[0]:
-                encoded_sentence_tokens.append(self.encoding_strategy.encode_head(head.span, head.label))
-
-            elif token is tail.span[0]:
-                encoded_sentence_tokens.append(self.encoding_strategy.encode_tail(tail.span, tail.label))
-
-            elif all(
-                token is not non_leading_entity_token
-                for non_leading_entity_token in itertools.chain(non_leading_head_tokens, non_leading_tail_tokens)
-            ):
-                encoded_sentence_tokens.append(token.text)
+        head_start: int = head.span[0].idx - 1
+        head_end: int = head.span[-1].idx
+        tail_start: int = tail.span[0].idx - 1
+        tail_end: int = tail.span[-1].idx
+
+        encoded_sentence_tokens: List[str]
+        if head_end <= tail_start or tail_end <= head_start:
+            # For the regular case of non-overlapping spans, splice the head and tail encodings
+            # into the token texts at the spans' known positions,
+            # instead of checking every sentence token against all span boundaries.
+            if token_texts is None:
+                token_texts = [token.text for token in original_sentence]
+            head_encoding: str = self.encoding_strategy.encode_head(head.span, head.label)
+            tail_encoding: str = self.encoding_strategy.encode_tail(tail.span, tail.label)
+            if head_end <= tail_start:
+                encoded_sentence_tokens = (
+                    token_texts[:head_start]
+                    + [head_encoding]
+                    + token_texts[head_end:tail_start]
+                    + [tail_encoding]
+                    + token_texts[tail_end:]
+                )
+            else:
+                encoded_sentence_tokens = (
+                    token_texts[:tail_start]
+                    + [tail_encoding]
+                    + token_texts[tail_end:head_start]
+                    + [head_encoding]
+                    + token_texts[head_end:]
+                )
+        else:
+            # Fall back to a full token walk for (pathological) overlapping head and tail spans
+            non_leading_head_tokens: List[Token] = head.span.tokens[1:]
+            non_leading_tail_tokens: List[Token] = tail.span.tokens[1:]
+            encoded_sentence_tokens = []
+            for token in original_sentence:
+                if token is head.span[0]:
+                    encoded_sentence_tokens.append(self.encoding_strategy.encode_head(head.span, head.label))
+
+                elif token is tail.span[0]:
+                    encoded_sentence_tokens.append(self.encoding_strategy.encode_tail(tail.span, tail.label))
+
+                elif all(
+                    token is not non_leading_entity_token
+                    for non_leading_entity_token in itertools.chain(non_leading_head_tokens, non_leading_tail_tokens)
+                ):
+                    encoded_sentence_tokens.append(token.text)
 
         # Create masked sentence
         encoded_sentence: EncodedSentence = EncodedSentence(
@@ -481,11 +528,13 @@ class RelationClassifier(flair.nn.DefaultClassifier[EncodedSentence, EncodedSent
         :return: Encoded sentences annotated with their gold relation and
                  the corresponding relation in the original sentence
         """
+        token_texts: List[str] = [token.text for token in sentence]
         for head, tail, gold_label in self._entity_pair_permutations(sentence):
             masked_sentence: EncodedSentence = self._encode_sentence(
                 head=head,
                 tail=tail,
                 gold_label=gold_label if gold_label is not None else self.zero_tag_value,
+                token_texts=token_texts,
             )
             original_relation: Relation = Relation(first=head.span, second=tail.span)
             yield masked_sentence, original_relation
@@ -496,6 +545,7 @@ class RelationClassifier(flair.nn.DefaultClassifier[EncodedSentence, EncodedSent
         with the option of disabling cross augmentation via `self.cross_augmentation`
         (and that the relation with reference to the original sentence is not returned).
         """
+        token_texts: List[str] = [token.text for token in sentence]
         for head, tail, gold_label in self._entity_pair_permutations(sentence):
             if gold_label is None:
                 if self.cross_augmentation:
@@ -507,6 +557,7 @@ class RelationClassifier(flair.nn.DefaultClassifier[EncodedSentence, EncodedSent
                 head=head,
                 tail=tail,
                 gold_label=gold_label,
+                token_texts=token_texts,
             )
 
             yield masked_sentence
@@ -6,7 +6,7 @@ import torch
 
 import flair.embeddings
 import flair.nn
-from flair.data import Relation, Sentence
+from flair.data import Relation, Sentence, Token
 from flair.file_utils import cached_path
 
 log = logging.getLogger("flair")
@@ -33,11 +33,16 @@ class RelationExtractor(flair.nn.DefaultClassifier[Sentence, Relation]):
         (if any label's weight is unspecified it will default to 1.0)
         """
 
-        # pooling operation to get embeddings for entites
+        # pooling operation to get embeddings for entites. The operation is resolved
+        # once here, so the embedding paths dispatch directly through
+        # _span_boundary_tokens instead of re-checking the flag for every entity pair
         self.pooling_operation = pooling_operation
         relation_representation_length = 2 * embeddings.embedding_length
         if self.pooling_operation == "first_last":
             relation_representation_length *= 2
+            self._span_boundary_tokens = self._span_boundary_tokens_first_last
+        else:
+            self._span_boundary_tokens = self._span_boundary_tokens_first
         super(RelationExtractor, self).__init__(
             embeddings=embeddings,
             final_embedding_size=relation_representation_length,
@@ -64,19 +69,22 @@ class RelationExtractor(flair.nn.DefaultClassifier[Sentence, Relation]):
         entity_pairs = []
         entity_spans = sentence.get_spans(self.entity_label_type)
 
-        for span_1 in entity_spans:
-            for span_2 in entity_spans:
-                if span_1 == span_2:
+        # sentences with fewer than two entities cannot produce any relation candidate
+        if len(entity_spans) < 2:
+            return entity_pairs
+
+        # look up the label value of each span only once instead of once per pair
+        span_label_values = [span.get_label(self.entity_label_type).value for span in entity_spans]
+
+        for span_1, label_value_1 in zip(entity_spans, span_label_values):
+            for span_2, label_value_2 in zip(entity_spans, span_label_values):
+                if span_1 is span_2:
                     continue
 
                 # filter entity pairs according to their tags if set
                 if (
                     self.entity_pair_filters is not None
-                    and (
-                        span_1.get_label(self.entity_label_type).value,
-                        span_2.get_label(self.entity_label_type).value,
-                    )
-                    not in self.entity_pair_filters
+                    and (label_value_1, label_value_2) not in self.entity_pair_filters
                 ):
                     continue
 
@@ -86,25 +94,53 @@ class RelationExtractor(flair.nn.DefaultClassifier[Sentence, Relation]):
                 entity_pairs.append(relation)
         return entity_pairs
 
-    def _get_embedding_for_data_point(self, prediction_data_point: Relation) -> torch.Tensor:
-        span_1 = prediction_data_point.first
-        span_2 = prediction_data_point.second
+    def _get_embedding_for_data_points(self, prediction_data_points: List[Relation]) -> torch.Tensor:
         embedding_names = self.embeddings.get_names()
 
-        if self.pooling_operation == "first_last":
-            return torch.cat(
-                [
-                    span_1.tokens[0].get_embedding(embedding_names),
-                    span_1.tokens[-1].get_embedding(embedding_names),
-                    span_2.tokens[0].get_embedding(embedding_names),
-                    span_2.tokens[-1].get_embedding(embedding_names),
-                ]
-            )
-        else:
-            return torch.cat(
-                [span_1.tokens[0].get_embedding(embedding_names), span_2.tokens[0].get_embedding(embedding_names)]
+        # stack the token embeddings of each sentence once and reuse the matrix for all its entity pairs
+        sentence_offsets: Dict[int, int] = {}
+        token_matrices: List[torch.Tensor] = []
+        token_count = 0
+        for relation in prediction_data_points:
+            sentence = relation.sentence
+            if id(sentence) not in sentence_offsets:
+                sentence_offsets[id(sentence)] = token_count
+                token_matrices.append(torch.stack([token.get_embedding(embedding_names) for token in sentence.tokens]))
+                token_count += len(sentence.tokens)
+        token_matrix = token_matrices[0] if len(token_matrices) == 1 else torch.cat(token_matrices)
+
+        # collect the global index of each span boundary token
+        span_boundary_indices: List[Tuple[int, ...]] = []
+        for relation in prediction_data_points:
+            offset = sentence_offsets[id(relation.sentence)]
+            span_boundary_indices.append(
+                tuple(offset + token.idx - 1 for token in self._span_boundary_tokens(relation))
             )
 
+        # gather all boundary token embeddings at once and flatten the boundary dimension,
+        # writing each relation representation directly into one contiguous buffer
+        index_matrix = torch.tensor(span_boundary_indices, dtype=torch.long, device=flair.device)
+        return token_matrix[index_matrix].reshape(len(prediction_data_points), -1)
+
+    def _get_embedding_for_data_point(self, prediction_data_point: Relation) -> torch.Tensor:
+        embedding_names = self.embeddings.get_names()
+        return torch.cat(
+            [token.get_embedding(embedding_names) for token in self._span_boundary_tokens(prediction_data_point)]
+        )
+
+    @staticmethod
+    def _span_boundary_tokens_first_last(relation: Relation) -> Tuple[Token, ...]:
+        return (
+            relation.first.tokens[0],
+            relation.first.tokens[-1],
+            relation.second.tokens[0],
+            relation.second.tokens[-1],
+        )
+
+    @staticmethod
+    def _span_boundary_tokens_first(relation: Relation) -> Tuple[Token, ...]:
+        return relation.first.tokens[0], relation.second.tokens[0]
+
     def _print_predictions(self, batch, gold_label_type):
         lines = []
         for datapoint in batch:
@@ -173,13 +173,12 @@ class Model(torch.nn.Module, typing.Generic[DT], ABC):
 
             # older (flair 11.3 and below) models do not contain cls information. In this case, try all subclasses
             for model_cls in subclasses:
-                # if str(model_cls) == "<class 'flair.models.pairwise_classification_model.TextPairClassifier'>": continue
                 try:
                     model = model_cls.load(state)
                     return model
                 except Exception as e:
-                    print(e)
                     # skip any invalid loadings, e.g. not found on huggingface hub
+                    log.debug(f"Could not load model as {model_cls.__name__}: {e}")
                     continue
 
             raise ValueError(f"Could not find any model with name '{model_path}'")
@@ -607,6 +606,11 @@ class DefaultClassifier(Classifier[DT], typing.Generic[DT, DT2], ABC):
         self.final_embedding_size = final_embedding_size
         self.inverse_model = inverse_model
 
+        # optional reduced-precision dtype for decoding during prediction. Set this to
+        # e.g. torch.bfloat16 to run the decoder under autocast at inference time;
+        # the default of None keeps full precision. Not part of the model state.
+        self.inference_dtype: Optional[torch.dtype] = None
+
         # init dropouts
         self.dropout: torch.nn.Dropout = torch.nn.Dropout(dropout)
         self.locked_dropout = flair.nn.LockedDropout(locked_dropout)
@@ -683,25 +687,33 @@ class DefaultClassifier(Classifier[DT], typing.Generic[DT, DT2], ABC):
     def _prepare_label_tensor(self, prediction_data_points: List[DT2]) -> torch.Tensor:
         labels = [self._get_label_of_datapoint(dp) for dp in prediction_data_points]
         if self.multi_label:
+            # decode the label dictionary once instead of once per data point
+            all_label_values = self.label_dictionary.get_items()
             return torch.tensor(
                 [
-                    [1 if label in all_labels_for_point else 0 for label in self.label_dictionary.get_items()]
+                    [1 if label in all_labels_for_point else 0 for label in all_label_values]
                     for all_labels_for_point in labels
                 ],
                 dtype=torch.float,
                 device=flair.device,
             )
         else:
-            return torch.tensor(
-                [
-                    self.label_dictionary.get_idx_for_item(label[0])
-                    if len(label) > 0
-                    else self.label_dictionary.get_idx_for_item("O")
-                    for label in labels
-                ],
-                dtype=torch.long,
-                device=flair.device,
-            )
+            # resolve the zero label's index at most once per batch instead of once per unlabeled point
+            zero_label_idx: Optional[int] = None
+            label_indices = []
+            for label in labels:
+                if len(label) > 0:
+                    label_indices.append(self.label_dictionary.get_idx_for_item(label[0]))
+                else:
+                    if zero_label_idx is None:
+                        zero_label_idx = self.label_dictionary.get_idx_for_item("O")
+                    label_indices.append(zero_label_idx)
+            return torch.tensor(label_indices, dtype=torch.long, device=flair.device)
+
+    def _get_embedding_for_data_points(self, prediction_data_points: List[DT2]) -> torch.Tensor:
+        """Default implementation that embeds each data point separately and stacks the results.
+        Overwrite this method to embed all data points of a batch at once."""
+        return torch.stack([self._get_embedding_for_data_point(data_point) for data_point in prediction_data_points])
 
     def _encode_data_points(self, sentences: List[DT], data_points: List[DT2]):
         # embed sentences
@@ -709,14 +721,18 @@ class DefaultClassifier(Classifier[DT], typing.Generic[DT, DT2], ABC):
             self.embeddings.embed(sentences)
 
         # get a tensor of data points
-        data_point_tensor = torch.stack([self._get_embedding_for_data_point(data_point) for data_point in data_points])
-
-        # do dropout
-        data_point_tensor = data_point_tensor.unsqueeze(1)
-        data_point_tensor = self.dropout(data_point_tensor)
-        data_point_tensor = self.locked_dropout(data_point_tensor)
-        data_point_tensor = self.word_dropout(data_point_tensor)
-        data_point_tensor = data_point_tensor.squeeze(1)
+        data_point_tensor = self._get_embedding_for_data_points(data_points)
+
+        # do dropout (skip the module calls entirely for zero rates, the default config)
+        if self.dropout.p > 0.0 or self.locked_dropout.dropout_rate > 0.0 or self.word_dropout.dropout_rate > 0.0:
+            data_point_tensor = data_point_tensor.unsqueeze(1)
+            if self.dropout.p > 0.0:
+                data_point_tensor = self.dropout(data_point_tensor)
+            if self.locked_dropout.dropout_rate > 0.0:
+                data_point_tensor = self.locked_dropout(data_point_tensor)
+            if self.word_dropout.dropout_rate > 0.0:
+                data_point_tensor = self.word_dropout(data_point_tensor)
+            data_point_tensor = data_point_tensor.squeeze(1)
 
         return data_point_tensor
 
@@ -725,7 +741,9 @@ class DefaultClassifier(Classifier[DT], typing.Generic[DT, DT2], ABC):
 
     def forward_loss(self, sentences: List[DT]) -> Tuple[torch.Tensor, int]:
         # make a forward pass to produce embedded data points and labels
-        sentences = [sentence for sentence in sentences if self._filter_data_point(sentence)]
+        # (only copy the batch list if any data point actually gets filtered)
+        if not all(self._filter_data_point(sentence) for sentence in sentences):
+            sentences = [sentence for sentence in sentences if self._filter_data_point(sentence)]
 
         # get the data points for which to predict labels
         data_points = self._get_data_points_for_batch(sentences)
@@ -822,8 +840,9 @@ class DefaultClassifier(Classifier[DT], typing.Generic[DT, DT2], ABC):
             overall_loss = torch.zeros(1, device=flair.device)
             label_count = 0
             for batch in batches:
-                # filter data points in batch
-                batch = [dp for dp in batch if self._filter_data_point(dp)]
+                # filter data points in batch (only copy the batch list if anything gets filtered)
+                if not all(self._filter_data_point(dp) for dp in batch):
+                    batch = [dp for dp in batch if self._filter_data_point(dp)]
 
                 # stop if all sentences are empty
                 if not batch:
@@ -836,7 +855,13 @@ class DefaultClassifier(Classifier[DT], typing.Generic[DT, DT2], ABC):
 
                 # pass data points through network and decode
                 data_point_tensor = self._encode_data_points(batch, data_points)
-                scores = self.decoder(data_point_tensor)
+                if self.inference_dtype is not None:
+                    # decode under reduced-precision autocast, but score in full precision
+                    with torch.autocast(device_type=flair.device.type, dtype=self.inference_dtype):
+                        scores = self.decoder(data_point_tensor)
+                    scores = scores.float()
+                else:
+                    scores = self.decoder(data_point_tensor)
                 scores = self._mask_scores(scores, data_points)
 
                 # if anything could possibly be predicted
@@ -853,9 +878,11 @@ class DefaultClassifier(Classifier[DT], typing.Generic[DT, DT2], ABC):
                     if self.multi_label:
                         sigmoided = torch.sigmoid(scores)  # size: (n_sentences, n_classes)
                         n_labels = sigmoided.size(1)
+                        # decode each label value once per batch instead of once per data point
+                        label_values = [self.label_dictionary.get_item_for_index(l_idx) for l_idx in range(n_labels)]
                         for s_idx, data_point in enumerate(data_points):
                             for l_idx in range(n_labels):
-                                label_value = self.label_dictionary.get_item_for_index(l_idx)
+                                label_value = label_values[l_idx]
                                 if label_value == "O":
                                     continue
                                 label_threshold = self._get_label_threshold(label_value)
@@ -867,9 +894,12 @@ class DefaultClassifier(Classifier[DT], typing.Generic[DT, DT2], ABC):
 
                         if return_probabilities_for_all_classes:
                             n_labels = softmax.size(1)
+                            label_values = [
+                                self.label_dictionary.get_item_for_index(l_idx) for l_idx in range(n_labels)
+                            ]
                             for s_idx, data_point in enumerate(data_points):
                                 for l_idx in range(n_labels):
-                                    label_value = self.label_dictionary.get_item_for_index(l_idx)
+                                    label_value = label_values[l_idx]
                                     if label_value == "O":
                                         continue
                                     label_score = softmax[s_idx, l_idx].item()
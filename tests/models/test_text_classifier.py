@@ -1,4 +1,7 @@
+import math
+
 import pytest
+import torch
 
 import flair.datasets
 from flair.data import Sentence
@@ -63,6 +66,27 @@ class TestTextClassifier(BaseModelTest):
         loaded_model.predict([example_sentence, self.empty_sentence])
         loaded_model.predict([self.empty_sentence])
 
+    @pytest.mark.integration
+    def test_predict_with_inference_dtype(self, results_base_path, corpus, embeddings, train_test_sentence):
+        flair.set_seed(123)
+        label_dict = corpus.make_label_dictionary(label_type=self.train_label_type)
+
+        model = self.model_cls(embeddings=embeddings, label_dictionary=label_dict, label_type=self.train_label_type)
+
+        trainer = ModelTrainer(model, corpus)
+        trainer.train(results_base_path, max_epochs=1, shuffle=False)
+
+        model.inference_dtype = torch.bfloat16
+        model.predict(train_test_sentence)
+
+        labels = train_test_sentence.get_labels(self.train_label_type)
+        assert len(labels) > 0
+        for label in labels:
+            assert label.value is not None
+            assert isinstance(label.score, float)
+            assert math.isfinite(label.score)
+            assert 0.0 <= label.score <= 1.0
+
     @pytest.mark.integration
     def test_predict_with_prob(self, example_sentence, loaded_pretrained_model):
         loaded_pretrained_model.predict(example_sentence, return_probabilities_for_all_classes=True)